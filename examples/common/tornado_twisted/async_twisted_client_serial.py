@@ -78,15 +78,14 @@ class ExampleProtocol(ModbusClientProtocol):
 
 
 if __name__ == "__main__":
-    import time
-
-    proto, client = AsyncModbusSerialClient(  # pylint: disable=unpacking-non-sequence
+    # The reactor is run on the main thread, so the EventLoopThread
+    # returned by the factory is not started.
+    _, client = AsyncModbusSerialClient(  # pylint: disable=unpacking-non-sequence
         schedulers.REACTOR,
         method="rtu",
         port=SERIAL_PORT,
         timeout=2,
         proto_cls=ExampleProtocol,
-    ) 
-    proto.start()
-    time.sleep(10)  # Wait for operation to complete
-    # proto.stop()
+    )
+    reactor.callLater(10, reactor.stop)  # pylint: disable=no-member
+    reactor.run()  # pylint: disable=no-member
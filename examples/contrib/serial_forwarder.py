@@ -32,6 +32,11 @@ def run_serial_forwarder():
 
     # ----------------------------------------------------------------------- #
     client = ModbusClient(method="rtu", port="/tmp/ptyp0")  # nosec
+    # Open the serial port once up front, all forwarded requests share it.
+    # After an I/O error the client closes the port and reopens it on the
+    # next request, and the failed request is answered with an error.
+    if not client.connect():
+        log.warning("Unable to connect to %s, retrying on first request", client)
     # If required to communicate with a specified client use unit=<unit_id>
     # in RemoteSlaveContext
     # For e.g to forward the requests to slave with unit address 1 use
@@ -42,7 +47,10 @@ def run_serial_forwarder():
     # ----------------------------------------------------------------------- #
     # run the server you want
     # ----------------------------------------------------------------------- #
-    StartServer(context, address=("localhost", 5020))
+    # tcp_nodelay sends each response immediately instead of letting
+    # Nagle's algorithm hold it back waiting for more data
+    StartServer(context, address=("localhost", 5020), tcp_nodelay=True)
+    client.close()
 
 
 if __name__ == "__main__":
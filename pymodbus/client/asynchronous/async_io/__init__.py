@@ -179,17 +179,46 @@ class BaseModbusAsyncClientProtocol(AsyncModbusClientMixin):
         self._connected = False
 
 
-class ModbusClientProtocol(BaseModbusAsyncClientProtocol, asyncio.Protocol):
-    """Asyncio specific implementation of asynchronous modbus client protocol."""
+class ModbusClientProtocol(BaseModbusAsyncClientProtocol, asyncio.BufferedProtocol):
+    """Asyncio specific implementation of asynchronous modbus client protocol.
+
+    Transports that support buffered protocols (tcp, tls) read straight
+    into a receive buffer owned by the protocol and pass the received
+    part to data_received as a memoryview, other transports (serial)
+    call data_received with bytes.
+    """
 
     #: Factory that created this instance.
     factory = None
     transport = None
+    #: Size in bytes of the receive buffer handed to the transport.
+    RECV_BUFFER_SIZE = 65536
+    _recv_buffer = None
+
+    def get_buffer(self, sizehint):
+        """Return the buffer the transport should receive data into.
+
+        The framer copies everything it is handed into its own frame
+        buffer, so the same receive buffer can be reused for every read.
+
+        :param sizehint:
+        """
+        if self._recv_buffer is None:
+            self._recv_buffer = memoryview(bytearray(self.RECV_BUFFER_SIZE))
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        """Call when the transport wrote data into the receive buffer.
+
+        :param nbytes: The number of bytes received
+        """
+        self.data_received(self._recv_buffer[:nbytes])
 
     def data_received(self, data):
         """Call when some data is received.
 
-        data is a non-empty bytes object containing the incoming data.
+        data is a non-empty bytes-like object containing the incoming data,
+        it is only valid until this call returns.
 
         :param data:
         """
@@ -698,6 +727,7 @@ class AsyncioModbusSerialClient:
 
     transport = None
     framer = None
+    connect_task = None
 
     def __init__(
         self,
@@ -9,7 +9,6 @@ from pymodbus.client.asynchronous.async_io import (
     ModbusClientProtocol,
 )
 from pymodbus.client.asynchronous.thread import EventLoopThread
-from pymodbus.factory import ClientDecoder
 
 _logger = logging.getLogger(__name__)
 
@@ -52,7 +51,6 @@ def reactor_factory(port, framer, **kwargs):
 
             :param factory: The factory to build clients with
             """
-            self.decoder = ClientDecoder()
             proto_cls = kwargs.pop("proto_cls", None)
             proto = SerialClientFactory(framer, proto_cls).buildProtocol()
             SerialPort.__init__(self, proto, *args, **kwargs)
@@ -75,11 +73,16 @@ def async_io_factory(port=None, framer=None, **kwargs):
     :param framer: Modbus Framer
     :param kwargs: Serial port options
     :return: asyncio event loop and serial client
+
+    When called from a coroutine running on the event loop, the
+    connection is started in the background instead of being waited
+    for; await ``client.connect_task`` to wait for it.
     """
     try:
-        loop = kwargs.pop("loop", None) or asyncio.get_running_loop()
+        running_loop = asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
+        running_loop = None
+    loop = kwargs.pop("loop", None) or running_loop or asyncio.new_event_loop()
 
     proto_cls = kwargs.get("proto_cls") or ModbusClientProtocol
 
@@ -87,7 +90,10 @@ def async_io_factory(port=None, framer=None, **kwargs):
     coro = client.connect
     if not loop.is_running():
         loop.run_until_complete(coro())
-    else:  # loop is not asyncio.get_event_loop():
+    elif loop is running_loop:
+        # Called from within the loop, waiting for the result would deadlock.
+        client.connect_task = loop.create_task(coro())
+    else:
         future = asyncio.run_coroutine_threadsafe(coro(), loop=loop)
         future.result()
 
@@ -106,7 +112,8 @@ def get_factory(scheduler):
     if scheduler == schedulers.ASYNC_IO:
         return async_io_factory
 
-    txt = f"Allowed Schedulers: {schedulers.REACTOR}, {schedulers.ASYNC_IO}"
-    _logger.warning(txt)
+    _logger.warning(
+        "Allowed Schedulers: %s, %s", schedulers.REACTOR, schedulers.ASYNC_IO
+    )
     txt = f'Invalid Scheduler "{scheduler}"'
     raise Exception(txt)
@@ -11,6 +11,16 @@ from pymodbus.constants import Defaults
 _logger = logging.getLogger(__name__)
 
 
+def _set_tcp_nodelay(protocol):
+    """Disable Nagle's algorithm on a connected twisted protocol.
+
+    :param protocol: The connected protocol
+    :return: The protocol
+    """
+    protocol.transport.setTcpNoDelay(True)
+    return protocol
+
+
 def reactor_factory(
     host="127.0.0.1",
     port=Defaults.Port,
@@ -26,7 +36,7 @@ def reactor_factory(
     :param framer: Modbus Framer
     :param source_address: Bind address
     :param timeout: Timeout in seconds
-    :param kwargs:
+    :param kwargs: callback, errback and tcp_nodelay (disable Nagle's algorithm)
     :return: event_loop_thread and twisted_deferred
     """
     from twisted.internet import (  # pylint: disable=import-outside-toplevel
@@ -45,6 +55,9 @@ def reactor_factory(
     callback = kwargs.get("callback")
     errback = kwargs.get("errback")
 
+    if kwargs.get("tcp_nodelay"):
+        deferred.addCallback(_set_tcp_nodelay)
+
     if callback:
         deferred.addCallback(callback)
 
@@ -105,7 +118,8 @@ def get_factory(scheduler):
     if scheduler == schedulers.ASYNC_IO:
         return async_io_factory
 
-    txt = f"Allowed Schedulers: {schedulers.REACTOR}, {schedulers.ASYNC_IO}"
-    _logger.warning(txt)
+    _logger.warning(
+        "Allowed Schedulers: %s, %s", schedulers.REACTOR, schedulers.ASYNC_IO
+    )
     txt = f'Invalid Scheduler "{scheduler}"'
     raise Exception(txt)
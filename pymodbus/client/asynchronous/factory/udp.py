@@ -71,7 +71,8 @@ def get_factory(scheduler):
     if scheduler == schedulers.ASYNC_IO:
         return async_io_factory
 
-    txt = f"Allowed Schedulers: {schedulers.REACTOR}, {schedulers.ASYNC_IO}"
-    _logger.warning(txt)
+    _logger.warning(
+        "Allowed Schedulers: %s, %s", schedulers.REACTOR, schedulers.ASYNC_IO
+    )
     txt = f'Invalid Scheduler "{scheduler}"'
     raise Exception(txt)
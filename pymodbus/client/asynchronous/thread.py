@@ -35,12 +35,10 @@ class EventLoopThread:
 
     def start(self):
         """Start the backend event loop."""
-        txt = f'Starting Event Loop: "PyModbus_{self._name}"'
-        _logger.info(txt)
+        _logger.info('Starting Event Loop: "PyModbus_%s"', self._name)
         self._event_loop.start()
 
     def stop(self):
         """Stop the backend event loop."""
-        txt = f'Stopping Event Loop: "PyModbus_{self._name}"'
-        _logger.info(txt)
+        _logger.info('Stopping Event Loop: "PyModbus_%s"', self._name)
         self._stop_loop()
@@ -1,6 +1,7 @@
 """Remote datastore."""
 # pylint: disable=missing-type-doc
 import logging
+import threading
 
 from pymodbus.exceptions import NotImplementedException
 from pymodbus.interfaces import IModbusSlaveContext
@@ -19,6 +20,11 @@ class RemoteSlaveContext(IModbusSlaveContext):
 
     This creates a modbus data model that connects to
     a remote device (depending on the client used)
+
+    The server validates every request before reading the values, so the
+    response fetched by :meth:`validate` is reused by a directly following
+    :meth:`getValues` for the same range, instead of asking the remote
+    device twice.
     """
 
     def __init__(self, client, unit=None):
@@ -29,6 +35,7 @@ class RemoteSlaveContext(IModbusSlaveContext):
         """
         self._client = client
         self.unit = unit
+        self._validated = threading.local()
         self.__build_mapping()
 
     def reset(self):
@@ -45,7 +52,9 @@ class RemoteSlaveContext(IModbusSlaveContext):
         """
         txt = f"validate[{fc_as_hex}] {address}:{count}"
         _logger.debug(txt)
-        result = self.__get_callbacks[self.decode(fc_as_hex)](address, count)
+        request = (self.decode(fc_as_hex), address, count)
+        result = self.__get_callbacks[request[0]](address, count)
+        self._validated.response = (request, result)
         return not result.isError()
 
     def getValues(self, fc_as_hex, address, count=1):
@@ -59,8 +68,11 @@ class RemoteSlaveContext(IModbusSlaveContext):
         # TODO deal with deferreds # pylint: disable=fixme
         txt = f"get values[{fc_as_hex}] {address}:{count}"
         _logger.debug(txt)
-        result = self.__get_callbacks[self.decode(fc_as_hex)](address, count)
-        return self.__extract_result(self.decode(fc_as_hex), result)
+        request = (self.decode(fc_as_hex), address, count)
+        validated, result = self.__pop_validated()
+        if validated != request:
+            result = self.__get_callbacks[request[0]](address, count)
+        return self.__extract_result(request[0], result)
 
     def setValues(self, fc_as_hex, address, values):
         """Set the datastore with the supplied values.
@@ -72,6 +84,7 @@ class RemoteSlaveContext(IModbusSlaveContext):
         # TODO deal with deferreds # pylint: disable=fixme
         txt = f"set values[{fc_as_hex}] {address}:{len(values)}"
         _logger.debug(txt)
+        self.__pop_validated()
         self.__set_callbacks[self.decode(fc_as_hex)](address, values)
 
     def __str__(self):
@@ -81,6 +94,18 @@ class RemoteSlaveContext(IModbusSlaveContext):
         """
         return f"Remote Slave Context({self._client})"
 
+    def __pop_validated(self):
+        """Return and forget the response fetched by the last validate call.
+
+        The response is kept per thread, as each client connection of
+        the threaded servers is handled in its own thread.
+
+        :returns: A (request, response) pair, (None, None) if there is none
+        """
+        response = getattr(self._validated, "response", (None, None))
+        self._validated.response = (None, None)
+        return response
+
     def __build_mapping(self):
         """Build the function code mapper."""
         kwargs = {}
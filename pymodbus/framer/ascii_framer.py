@@ -55,8 +55,8 @@ class ModbusAsciiFramer(ModbusFramer):
     def decode_data(self, data):  # pylint: disable=no-self-use
         """Decode data."""
         if len(data) > 1:
-            uid = int(data[1:3], 16)
-            fcode = int(data[3:5], 16)
+            uid = int(bytes(data[1:3]), 16)
+            fcode = int(bytes(data[3:5]), 16)
             return {"unit": uid, "fcode": fcode}
         return {}
 
@@ -241,7 +241,7 @@ class ModbusRtuFramer(ModbusFramer):
                 _logger.debug("Frame check failed, ignoring!!")
                 self.resetFrame()
         else:
-            txt = f"Frame - [{data}] not ready"
+            txt = f"Frame - [{hexlify_packets(data)}] not ready"
             _logger.debug(txt)
 
     def buildPacket(self, message):
@@ -5,7 +5,8 @@ modbus messages payloads.
 """
 # pylint: disable=missing-type-doc
 import logging
-from struct import pack, unpack
+from itertools import chain
+from struct import Struct, pack, unpack
 
 from pymodbus.constants import Endian
 from pymodbus.exceptions import ParameterException
@@ -18,7 +19,47 @@ from pymodbus.utilities import make_byte_string, pack_bitstring, unpack_bitstrin
 _logger = logging.getLogger(__name__)
 
 
-WC = {"b": 1, "h": 2, "e": 2, "i": 4, "l": 4, "q": 8, "f": 4, "d": 8}
+# Precompiled struct objects, keyed by (byteorder, format code), so the
+# format strings are parsed once at import instead of on every add/decode.
+_STRUCTS = {
+    (byteorder, code): Struct(byteorder + code)
+    for byteorder in "@=<>!"
+    for code in "bBhHiIqQefd"
+}
+
+# Word (unsigned 16 bit) groups, keyed by (byteorder, number of words).
+_WORDS = {
+    (byteorder, count): Struct(f"{byteorder}{count}H")
+    for byteorder in "@=<>!"
+    for count in (1, 2, 4)
+}
+
+# (byteorder, wordorder) combinations whose layout is a plain struct byte
+# order, mapped to that byte order. These need no word shuffling.
+_ORDERS = {
+    (Endian.Big, Endian.Big): Endian.Big,
+    ("!", Endian.Big): "!",
+    (Endian.Little, Endian.Little): Endian.Little,
+}
+
+# Bits of every byte value, most significant bit first.
+_BITS = [tuple(bool(byte & (0x80 >> bit)) for bit in range(8)) for byte in range(256)]
+
+# Maps the byte values 0 and 1 to the ASCII digits "0" and "1".
+_BINARY_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _reverse_words(words, wordcount):
+    """Reverse the order of the words within each value of a flat word list.
+
+    :param words: The words of all values, value after value
+    :param wordcount: The number of words per value
+    :returns: The words with each value's word order reversed
+    """
+    reordered = list(words)
+    for index in range(wordcount):
+        reordered[index::wordcount] = words[wordcount - 1 - index :: wordcount]
+    return reordered
 
 
 class BinaryPayloadBuilder(IPayloadBuilder):
@@ -44,7 +85,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         :param wordorder: The endianness of the word (when wordcount is >= 2)
         :param repack: Repack the provided payload based on BO
         """
-        self._payload = payload or []
+        self._payload = bytearray(b"".join(payload or []))
         self._byteorder = byteorder
         self._wordorder = wordorder
         self._repack = repack
@@ -63,28 +104,48 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         :param value: Value to be packed
         :return:
         """
-        value = pack(
-            "!{}".format(fstring), value  # pylint: disable=consider-using-f-string
-        )
-        wordorder = WC.get(fstring.lower()) // 2
-        upperbyte = f"!{wordorder}H"
-        payload = unpack(upperbyte, value)
+        if byteorder := _ORDERS.get((self._byteorder, self._wordorder)):
+            return _STRUCTS[(byteorder, fstring)].pack(value)
+
+        network = _STRUCTS[("!", fstring)]
+        value = network.pack(value)
+        wordcount = network.size // 2
+        payload = _WORDS[("!", wordcount)].unpack(value)
 
         if self._wordorder == Endian.Little:
-            payload = list(reversed(payload))
+            payload = payload[::-1]
 
-        fstring = self._byteorder + "H"
-        payload = [pack(fstring, word) for word in payload]
-        payload = b"".join(payload)
+        return _WORDS[(self._byteorder, wordcount)].pack(*payload)
 
-        return payload
+    def _pack_words_array(self, fstring, values):
+        """Pack a sequence of values based on the word order and byte order.
+
+        Works like :meth:`_pack_words`, but converts all values
+        with a handful of struct calls instead of one call per value.
+
+        :param fstring:
+        :param values: The values to be packed
+        :return:
+        """
+        if byteorder := _ORDERS.get((self._byteorder, self._wordorder)):
+            return pack(f"{byteorder}{len(values)}{fstring}", *values)
+
+        wordcount = _STRUCTS[("!", fstring)].size // 2
+        words = len(values) * wordcount
+        payload = pack(f"!{len(values)}{fstring}", *values)
+        payload = unpack(f"!{words}H", payload)
+
+        if self._wordorder == Endian.Little:
+            payload = _reverse_words(payload, wordcount)
+
+        return pack(f"{self._byteorder}{words}H", *payload)
 
     def to_string(self):
         """Return the payload buffer as a string.
 
         :returns: The payload buffer as a string
         """
-        return b"".join(self._payload)
+        return bytes(self._payload)
 
     def __str__(self):
         """Return the payload buffer as a string.
@@ -95,20 +156,18 @@ class BinaryPayloadBuilder(IPayloadBuilder):
 
     def reset(self):
         """Reset the payload buffer."""
-        self._payload = []
+        self._payload = bytearray()
 
     def to_registers(self):
         """Convert the payload buffer to register layout that can be used as a context block.
 
         :returns: The register layout to use as a block
         """
-        # fstring = self._byteorder+"H"
-        fstring = "!H"
-        payload = self.build()
         if self._repack:
-            payload = [unpack(self._byteorder + "H", value)[0] for value in payload]
+            word_struct = _STRUCTS[(self._byteorder, "H")]
         else:
-            payload = [unpack(fstring, value)[0] for value in payload]
+            word_struct = _STRUCTS[("!", "H")]
+        payload = [word_struct.unpack(value)[0] for value in self.build()]
         _logger.debug(payload)
         return payload
 
@@ -118,7 +177,8 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         :returns: The coil layout to use as a block
         """
         payload = self.to_registers()
-        coils = [bool(int(bit)) for reg in payload for bit in format(reg, "016b")]
+        payload = pack(f"!{len(payload)}H", *payload)
+        coils = list(chain.from_iterable(map(_BITS.__getitem__, payload)))
         return coils
 
     def build(self):
@@ -130,9 +190,9 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         :returns: The payload buffer as a list
         """
         string = self.to_string()
-        length = len(string)
-        string = string + (b"\x00" * (length % 2))
-        return [string[i : i + 2] for i in range(0, length, 2)]
+        if len(string) % 2:
+            string += b"\x00"
+        return [string[i : i + 2] for i in range(0, len(string), 2)]
 
     def add_bits(self, values):
         """Add a collection of bits to be encoded.
@@ -144,23 +204,21 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         :param values: The value to add to the buffer
         """
         value = pack_bitstring(values)
-        self._payload.append(value)
+        self._payload.extend(value)
 
     def add_8bit_uint(self, value):
         """Add a 8 bit unsigned int to the buffer.
 
         :param value: The value to add to the buffer
         """
-        fstring = self._byteorder + "B"
-        self._payload.append(pack(fstring, value))
+        self._payload.extend(_STRUCTS[(self._byteorder, "B")].pack(value))
 
     def add_16bit_uint(self, value):
         """Add a 16 bit unsigned int to the buffer.
 
         :param value: The value to add to the buffer
         """
-        fstring = self._byteorder + "H"
-        self._payload.append(pack(fstring, value))
+        self._payload.extend(_STRUCTS[(self._byteorder, "H")].pack(value))
 
     def add_32bit_uint(self, value):
         """Add a 32 bit unsigned int to the buffer.
@@ -170,7 +228,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         fstring = "I"
         # fstring = self._byteorder + "I"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_64bit_uint(self, value):
         """Add a 64 bit unsigned int to the buffer.
@@ -179,23 +237,21 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "Q"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_8bit_int(self, value):
         """Add a 8 bit signed int to the buffer.
 
         :param value: The value to add to the buffer
         """
-        fstring = self._byteorder + "b"
-        self._payload.append(pack(fstring, value))
+        self._payload.extend(_STRUCTS[(self._byteorder, "b")].pack(value))
 
     def add_16bit_int(self, value):
         """Add a 16 bit signed int to the buffer.
 
         :param value: The value to add to the buffer
         """
-        fstring = self._byteorder + "h"
-        self._payload.append(pack(fstring, value))
+        self._payload.extend(_STRUCTS[(self._byteorder, "h")].pack(value))
 
     def add_32bit_int(self, value):
         """Add a 32 bit signed int to the buffer.
@@ -204,7 +260,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "i"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_64bit_int(self, value):
         """Add a 64 bit signed int to the buffer.
@@ -213,7 +269,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "q"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_16bit_float(self, value):
         """Add a 16 bit float to the buffer.
@@ -222,7 +278,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "e"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_32bit_float(self, value):
         """Add a 32 bit float to the buffer.
@@ -231,7 +287,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "f"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
 
     def add_64bit_float(self, value):
         """Add a 64 bit float(double) to the buffer.
@@ -240,7 +296,16 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         fstring = "d"
         p_string = self._pack_words(fstring, value)
-        self._payload.append(p_string)
+        self._payload.extend(p_string)
+
+    def add_32bit_float_array(self, values):
+        """Add a sequence of 32 bit floats to the buffer.
+
+        :param values: The values to add to the buffer
+        """
+        fstring = "f"
+        p_string = self._pack_words_array(fstring, values)
+        self._payload.extend(p_string)
 
     def add_string(self, value):
         """Add a string to the buffer.
@@ -249,7 +314,7 @@ class BinaryPayloadBuilder(IPayloadBuilder):
         """
         value = make_byte_string(value)
         fstring = self._byteorder + str(len(value)) + "s"
-        self._payload.append(pack(fstring, value))
+        self._payload.extend(pack(fstring, value))
 
 
 class BinaryPayloadDecoder:
@@ -272,6 +337,7 @@ class BinaryPayloadDecoder:
         :param wordorder: The endianness of the word (when wordcount is >= 2)
         """
         self._payload = payload
+        self._view = memoryview(make_byte_string(payload))
         self._pointer = 0x00
         self._byteorder = byteorder
         self._wordorder = wordorder
@@ -299,7 +365,7 @@ class BinaryPayloadDecoder:
         """
         _logger.debug(registers)
         if isinstance(registers, list):  # repack into flat binary
-            payload = b"".join(pack("!H", x) for x in registers)
+            payload = pack(f"!{len(registers)}H", *registers)
             return cls(payload, byteorder, wordorder)
         raise ParameterException("Invalid collection of registers supplied")
 
@@ -327,13 +393,10 @@ class BinaryPayloadDecoder:
         :raises ParameterException:
         """
         if isinstance(coils, list):
-            payload = b""
-            if padding := len(coils) % 8:  # Pad zero"s
-                extra = [False] * padding
-                coils = extra + coils
-            chunks = cls.bit_chunks(coils)
-            for chunk in chunks:
-                payload += pack_bitstring(chunk[::-1])
+            # Left pad to whole bytes, the first coil is the most significant bit
+            size = (len(coils) + 7) // 8
+            bits = bytes(map(bool, coils)).translate(_BINARY_DIGITS)
+            payload = int(bits or b"0", 2).to_bytes(size, "big")
             return cls(payload, byteorder)
         raise ParameterException("Invalid collection of coils supplied")
 
@@ -350,117 +413,145 @@ class BinaryPayloadDecoder:
         :return:
         """
         handle = make_byte_string(handle)
-        wc_value = WC.get(fstring.lower()) // 2
-        handle = unpack(f"!{wc_value}H", handle)
+        if byteorder := _ORDERS.get((self._byteorder, self._wordorder)):
+            if byteorder == Endian.Little:
+                return bytes(handle[::-1])
+            return handle
+
+        wordcount = _STRUCTS[("!", fstring)].size // 2
+        handle = _WORDS[("!", wordcount)].unpack(handle)
         if self._wordorder == Endian.Little:
-            handle = list(reversed(handle))
+            handle = handle[::-1]
 
         # Repack as unsigned Integer
-        handle = [pack(self._byteorder + "H", p) for p in handle]
+        handle = _WORDS[(self._byteorder, wordcount)].pack(*handle)
         _logger.debug(handle)
-        handle = b"".join(handle)
         return handle
 
+    def _unpack_words_array(self, fstring, handle, count):
+        """Unpack a sequence of values based on the word order and byte order.
+
+        Works like :meth:`_unpack_words`, but converts all values
+        with a handful of struct calls instead of one call per value.
+
+        :param fstring:
+        :param handle: Values to be unpacked
+        :param count: The number of values in handle
+        :return:
+        """
+        handle = make_byte_string(handle)
+        wordcount = _STRUCTS[("!", fstring)].size // 2
+        words = count * wordcount
+        handle = unpack(f"{self._byteorder}{words}H", handle)
+        if self._wordorder == Endian.Little:
+            handle = _reverse_words(handle, wordcount)
+
+        # Repack as network ordered unsigned Integers
+        return pack(f"!{words}H", *handle)
+
     def reset(self):
         """Reset the decoder pointer back to the start."""
         self._pointer = 0x00
 
     def decode_8bit_uint(self):
         """Decode a 8 bit unsigned int from the buffer."""
+        handle = _STRUCTS[(self._byteorder, "B")].unpack_from(self._view, self._pointer)
         self._pointer += 1
-        fstring = self._byteorder + "B"
-        handle = self._payload[self._pointer - 1 : self._pointer]
-        handle = make_byte_string(handle)
-        return unpack(fstring, handle)[0]
+        return handle[0]
 
     def decode_bits(self):
         """Decode a byte worth of bits from the buffer."""
         self._pointer += 1
         # fstring = self._endian + "B"
-        handle = self._payload[self._pointer - 1 : self._pointer]
-        handle = make_byte_string(handle)
+        handle = self._view[self._pointer - 1 : self._pointer]
         return unpack_bitstring(handle)
 
     def decode_16bit_uint(self):
         """Decode a 16 bit unsigned int from the buffer."""
+        handle = _STRUCTS[(self._byteorder, "H")].unpack_from(self._view, self._pointer)
         self._pointer += 2
-        fstring = self._byteorder + "H"
-        handle = self._payload[self._pointer - 2 : self._pointer]
-        handle = make_byte_string(handle)
-        return unpack(fstring, handle)[0]
+        return handle[0]
 
     def decode_32bit_uint(self):
         """Decode a 32 bit unsigned int from the buffer."""
         self._pointer += 4
         fstring = "I"
         # fstring = "I"
-        handle = self._payload[self._pointer - 4 : self._pointer]
+        handle = self._view[self._pointer - 4 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_64bit_uint(self):
         """Decode a 64 bit unsigned int from the buffer."""
         self._pointer += 8
         fstring = "Q"
-        handle = self._payload[self._pointer - 8 : self._pointer]
+        handle = self._view[self._pointer - 8 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_8bit_int(self):
         """Decode a 8 bit signed int from the buffer."""
+        handle = _STRUCTS[(self._byteorder, "b")].unpack_from(self._view, self._pointer)
         self._pointer += 1
-        fstring = self._byteorder + "b"
-        handle = self._payload[self._pointer - 1 : self._pointer]
-        handle = make_byte_string(handle)
-        return unpack(fstring, handle)[0]
+        return handle[0]
 
     def decode_16bit_int(self):
         """Decode a 16 bit signed int from the buffer."""
+        handle = _STRUCTS[(self._byteorder, "h")].unpack_from(self._view, self._pointer)
         self._pointer += 2
-        fstring = self._byteorder + "h"
-        handle = self._payload[self._pointer - 2 : self._pointer]
-        handle = make_byte_string(handle)
-        return unpack(fstring, handle)[0]
+        return handle[0]
 
     def decode_32bit_int(self):
         """Decode a 32 bit signed int from the buffer."""
         self._pointer += 4
         fstring = "i"
-        handle = self._payload[self._pointer - 4 : self._pointer]
+        handle = self._view[self._pointer - 4 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_64bit_int(self):
         """Decode a 64 bit signed int from the buffer."""
         self._pointer += 8
         fstring = "q"
-        handle = self._payload[self._pointer - 8 : self._pointer]
+        handle = self._view[self._pointer - 8 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_16bit_float(self):
         """Decode a 16 bit float from the buffer."""
         self._pointer += 2
         fstring = "e"
-        handle = self._payload[self._pointer - 2 : self._pointer]
+        handle = self._view[self._pointer - 2 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_32bit_float(self):
         """Decode a 32 bit float from the buffer."""
         self._pointer += 4
         fstring = "f"
-        handle = self._payload[self._pointer - 4 : self._pointer]
+        handle = self._view[self._pointer - 4 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
 
     def decode_64bit_float(self):
         """Decode a 64 bit float(double) from the buffer."""
         self._pointer += 8
         fstring = "d"
-        handle = self._payload[self._pointer - 8 : self._pointer]
+        handle = self._view[self._pointer - 8 : self._pointer]
         handle = self._unpack_words(fstring, handle)
-        return unpack("!" + fstring, handle)[0]
+        return _STRUCTS[("!", fstring)].unpack(handle)[0]
+
+    def decode_32bit_float_array(self, count):
+        """Decode a sequence of 32 bit floats from the buffer.
+
+        :param count: The number of floats to decode
+        """
+        size = 4 * count
+        self._pointer += size
+        fstring = "f"
+        handle = self._view[self._pointer - size : self._pointer]
+        handle = self._unpack_words_array(fstring, handle, count)
+        return list(unpack(f"!{count}{fstring}", handle))
 
     def decode_string(self, size=1):
         """Decode a string from the buffer.
@@ -341,6 +341,9 @@ class ModbusTcpServer(socketserver.ThreadingTCPServer):
                         to a missing slave
         :param broadcast_enable: True to treat unit_id 0 as broadcast address,
                         False to treat 0 as any other unit_id
+        :param tcp_nodelay: True to disable Nagle's algorithm (TCP_NODELAY)
+                        on client connections, so responses are sent
+                        without delay
         """
         self.threads = []
         self.allow_reuse_address = allow_reuse_address
@@ -356,6 +359,7 @@ class ModbusTcpServer(socketserver.ThreadingTCPServer):
         self.broadcast_enable = kwargs.pop(
             "broadcast_enable", Defaults.broadcast_enable
         )
+        self.tcp_nodelay = kwargs.pop("tcp_nodelay", False)
 
         if isinstance(identity, ModbusDeviceIdentification):
             self.control.Identity.update(identity)
@@ -372,6 +376,8 @@ class ModbusTcpServer(socketserver.ThreadingTCPServer):
         """
         txt = f"Started thread to serve client at {str(client_address)}"
         _logger.debug(txt)
+        if self.tcp_nodelay:
+            request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         socketserver.ThreadingTCPServer.process_request(self, request, client_address)
 
     def shutdown(self):
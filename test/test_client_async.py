@@ -133,6 +133,21 @@ class TestAsynchronousClient:
         client.stop()
         loop.stop()
 
+    @pytest.mark.asyncio
+    async def test_serial_asyncio_client_in_loop(self):  # pylint: disable=no-self-use
+        """Test creating the serial asyncio client from within the running loop."""
+        with patch.object(AsyncioModbusSerialClient, "connect") as mock_connect:
+            result = AsyncModbusSerialClient(
+                schedulers.ASYNC_IO,
+                method="rtu",
+                port=pytest.SERIAL_PORT,
+            )
+            loop, client = result  # pylint: disable=unpacking-non-sequence
+            assert loop is asyncio.get_running_loop()  # nosec
+            assert client.connect_task is not None  # nosec
+            await client.connect_task
+            mock_connect.assert_awaited_once_with()
+
 
 # ---------------------------------------------------------------------------#
 # Main
@@ -342,6 +342,26 @@ class TestAsyncioClient:
             result = response.result()
             assert isinstance(result, ReadCoilsResponse)  # nosec
 
+    async def test_client_protocol_buffer_updated(self):  # pylint: disable=no-self-use
+        """Test the client protocol receiving into its own buffer"""
+        protocol = ModbusClientProtocol(ModbusSocketFramer(ClientDecoder()))
+        protocol.connection_made(mock.MagicMock())
+        data = b"\x00\x00\x12\x34\x00\x06\xff\x01\x01\x02\x00\x04"
+
+        response = protocol._build_response(0x00)  # pylint: disable=protected-access
+        buffer = protocol.get_buffer(-1)
+        assert len(buffer) >= len(data)  # nosec
+        buffer[: len(data)] = data
+        with mock.patch.object(
+            protocol, "data_received", wraps=protocol.data_received
+        ) as mock_received:
+            protocol.buffer_updated(len(data))
+        mock_received.assert_called_once()
+        assert bytes(mock_received.call_args[0][0]) == data  # nosec
+        result = response.result()
+        assert isinstance(result, ReadCoilsResponse)  # nosec
+        assert protocol.get_buffer(-1) is buffer  # nosec
+
     async def test_client_protocol_execute(self):  # pylint: disable=no-self-use
         """Test the client protocol execute method"""
         for protocol in protocols:
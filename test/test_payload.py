@@ -97,10 +97,24 @@ class ModbusPayloadUtilityTests(unittest.TestCase):
         builder.add_8bit_uint(0x78)
         self.assertEqual(b"\x12\x34\x56\x78", builder.to_string())
         self.assertEqual([b"\x12\x34", b"\x56\x78"], builder.build())
+        builder.add_8bit_uint(0x9A)
+        self.assertEqual([b"\x12\x34", b"\x56\x78", b"\x9a\x00"], builder.build())
         builder.reset()
         self.assertEqual(b"", builder.to_string())
         self.assertEqual([], builder.build())
 
+    def test_payload_builder_float_array(self):
+        """Test encoding a sequence of floats in one call"""
+        values = [1.25, -6.5, 0.0, 1024.75]
+        for byteorder in (Endian.Little, Endian.Big):
+            for wordorder in (Endian.Little, Endian.Big):
+                single = BinaryPayloadBuilder(byteorder=byteorder, wordorder=wordorder)
+                for value in values:
+                    single.add_32bit_float(value)
+                builder = BinaryPayloadBuilder(byteorder=byteorder, wordorder=wordorder)
+                builder.add_32bit_float_array(values)
+                self.assertEqual(single.to_string(), builder.to_string())
+
     def test_payload_builder_with_raw_payload(self):
         """Test basic bit message encoding/decoding"""
         _coils1 = [
@@ -229,6 +243,21 @@ class ModbusPayloadUtilityTests(unittest.TestCase):
         self.assertEqual(b"test", decoder.decode_string(4))
         self.assertEqual(self.bitstring, decoder.decode_bits())
 
+    def test_payload_decoder_float_array(self):
+        """Test decoding a sequence of floats in one call"""
+        values = [1.25, -6.5, 0.0, 1024.75]
+        for byteorder in (Endian.Little, Endian.Big):
+            for wordorder in (Endian.Little, Endian.Big):
+                builder = BinaryPayloadBuilder(byteorder=byteorder, wordorder=wordorder)
+                for value in values:
+                    builder.add_32bit_float(value)
+                builder.add_8bit_uint(0x11)
+                decoder = BinaryPayloadDecoder(
+                    builder.to_string(), byteorder=byteorder, wordorder=wordorder
+                )
+                self.assertEqual(values, decoder.decode_32bit_float_array(4))
+                self.assertEqual(0x11, decoder.decode_8bit_uint())
+
     def test_payload_decoder_reset(self):
         """Test the payload decoder reset functionality"""
         decoder = BinaryPayloadDecoder(b"\x12\x34")
@@ -263,10 +292,23 @@ class ModbusPayloadUtilityTests(unittest.TestCase):
         encoded = b"\x88\x11"
         self.assertEqual(encoded, decoder.decode_string(2))
 
+        payload = [1, 0, 0, 0, 1, 0, 0, 0, 1, 1]
+        decoder = BinaryPayloadDecoder.fromCoils(payload)
+        encoded = b"\x02\x23"
+        self.assertEqual(encoded, decoder.decode_string(2))
+
         self.assertRaises(
             ParameterException, lambda: BinaryPayloadDecoder.fromCoils("abcd")
         )
 
+    def test_payload_decoder_large_coil_factory(self):
+        """Test the payload decoder with a large collection of coils"""
+        encoded = bytes(range(256)) * 8
+        coils = BinaryPayloadBuilder([encoded], byteorder=Endian.Big).to_coils()
+        self.assertEqual(len(encoded) * 8, len(coils))
+        decoder = BinaryPayloadDecoder.fromCoils(coils)
+        self.assertEqual(encoded, decoder.decode_string(len(encoded)))
+
 
 # ---------------------------------------------------------------------------#
 #  Main
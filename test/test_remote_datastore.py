@@ -7,7 +7,11 @@ from pymodbus.bit_write_message import WriteMultipleCoilsResponse
 from pymodbus.datastore.remote import RemoteSlaveContext
 from pymodbus.exceptions import NotImplementedException
 from pymodbus.pdu import ExceptionResponse
-from pymodbus.register_read_message import ReadInputRegistersResponse
+from pymodbus.register_read_message import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+)
+from pymodbus.register_write_message import WriteMultipleRegistersResponse
 
 from .modbus_mocks import mock
 
@@ -65,6 +69,32 @@ class RemoteModbusDataStoreTest(unittest.TestCase):
         result = context.validate(3, 0, 10)
         self.assertFalse(result)
 
+    def test_remote_slave_validate_then_get_values(self):
+        """Test reusing the validate response when getting values"""
+        calls = []
+
+        def read_holding_registers(address, count):
+            calls.append((address, count))
+            return ReadHoldingRegistersResponse([address] * count)
+
+        client = mock()
+        client.read_holding_registers = read_holding_registers
+        client.write_registers = lambda a, b: WriteMultipleRegistersResponse(a, len(b))
+
+        context = RemoteSlaveContext(client)
+        self.assertTrue(context.validate(3, 0, 10))
+        self.assertEqual(context.getValues(3, 0, 10), [0] * 10)
+        self.assertEqual(calls, [(0, 10)])
+
+        self.assertTrue(context.validate(3, 5, 1))
+        self.assertEqual(context.getValues(3, 5, 2), [5] * 2)
+        self.assertEqual(calls, [(0, 10), (5, 1), (5, 2)])
+
+        self.assertTrue(context.validate(6, 7, 1))
+        context.setValues(6, 7, [1])
+        self.assertEqual(context.getValues(6, 7, 1), [7])
+        self.assertEqual(calls, [(0, 10), (5, 1), (5, 2), (7, 1), (7, 1)])
+
 
 # ---------------------------------------------------------------------------#
 #  Main
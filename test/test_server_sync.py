@@ -292,6 +292,17 @@ class SynchronousServerTest(unittest.TestCase):
             server.process_request("request", "client")
             self.assertTrue(mock_server.process_request.called)
 
+    def test_tcp_server_process_nodelay(self):
+        """Test that the synchronous TCP server disables nagle on request"""
+        with patch("socketserver.ThreadingTCPServer") as mock_server:
+            server = ModbusTcpServer(None, tcp_nodelay=True)
+            request = Mock()
+            server.process_request(request, "client")
+            request.setsockopt.assert_called_once_with(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
+            self.assertTrue(mock_server.process_request.called)
+
     # ----------------------------------------------------------------------- #
     # Test TLS Server
     # ----------------------------------------------------------------------- #